@@ -1,8 +1,10 @@
 from sqlmodel import SQLModel, select
+from sqlalchemy import delete, update, inspect, text
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from app.schema import UserQuestion, ChatInteraction, ChatMessage, UserAssessment
+from app.schema import UserQuestion, ChatInteraction, ChatMessage, UserAssessment, UserPracticeQueue
 from uuid import UUID
+from datetime import datetime
 from typing import List, Dict
 
 
@@ -12,7 +14,20 @@ engine = create_async_engine(DATABASE_URL)
 async def create_db_and_tables():
     async with engine.begin() as conn:
         await conn.run_sync(SQLModel.metadata.create_all)
-        
+        await conn.run_sync(add_missing_columns)
+
+
+def add_missing_columns(conn):
+    # create_all only creates missing tables, so nullable columns added to existing models are added here
+    inspector = inspect(conn)
+    for table in SQLModel.metadata.sorted_tables:
+        existing_columns = {column["name"] for column in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name not in existing_columns and column.nullable:
+                column_type = column.type.compile(dialect=conn.dialect)
+                conn.execute(text(f'ALTER TABLE {table.name} ADD COLUMN "{column.name}" {column_type}'))
+
+
 async def get_record(model, record_id: UUID):
     async with AsyncSession(engine) as session:
         record = await session.get(model, record_id)
@@ -70,3 +85,39 @@ async def bulk_update_records(model, updates: List[Dict[str, any]]):
                     for key, value in update.items():
                         setattr(record, key, value)
         await session.commit()
+
+
+async def replace_practice_queue(user_assessment_id: UUID, queue: List[UserPracticeQueue], only_if_unbuilt: bool = False, **kwargs) -> bool:
+    async with AsyncSession(engine) as session:
+        statement = (
+            update(UserAssessment)
+            .where(UserAssessment.id == user_assessment_id)
+            .values(practiceQueueBuiltAt=datetime.utcnow(), **kwargs)
+        )
+        if only_if_unbuilt:
+            statement = statement.where(UserAssessment.practiceQueueBuiltAt == None)
+        result = await session.execute(statement)
+        if result.rowcount == 0:
+            await session.rollback()
+            return False
+
+        await session.execute(delete(UserPracticeQueue).where(UserPracticeQueue.userAssessmentId == user_assessment_id))
+        session.add_all(queue)
+        await session.commit()
+        return True
+
+
+async def get_practice_questions(user_assessment_id: UUID, limit: int):
+    async with AsyncSession(engine) as session:
+        statement = (
+            select(UserQuestion)
+            .join(UserPracticeQueue, UserPracticeQueue.userQuestionId == UserQuestion.id)
+            .where(UserPracticeQueue.userAssessmentId == user_assessment_id)
+            .where(UserQuestion.isStudyComplete == False)
+            .order_by(UserPracticeQueue.position)
+            .limit(limit)
+        )
+        result = await session.execute(statement)
+        records = result.scalars().all()
+        return records
+
@@ -1,8 +1,7 @@
 from fastapi import APIRouter, HTTPException, Request
 from app.schema import UserAssessment, UserQuestion, ChatInteraction, ChatMessage, ChatMessageCreateModel, UserAssessmentCreateModel, UserAssessmentUpdateModel, ChatInteractionCreateModel, ChatMessageTypeEnum, FinalEvaluationReport
-from app.usecase import evaluate_question_complexity, extract_data_from_course, initialize_chat_interaction, continue_chat_interaction, generate_final_evaluation_report
-from app.db_adapter import insert_into_sqlite, get_record, get_all_records, update_record
-import random
+from app.usecase import evaluate_question_complexity, extract_data_from_course, initialize_chat_interaction, continue_chat_interaction, generate_final_evaluation_report, build_practice_queue
+from app.db_adapter import insert_into_sqlite, get_record, get_all_records, update_record, get_practice_questions
 from typing import List
 from uuid import UUID
 
@@ -74,7 +73,12 @@ async def update_user_assessment(userAssessmentId: UUID, payload: UserAssessment
 
     for user_question in user_question_without_assessment:
         await update_record(UserQuestion, user_question.id, **user_question_paylod)
-    return await update_record(UserAssessment, userAssessmentId, **payload.model_dump(exclude_unset=True))
+
+    updated_user_assessment = await update_record(UserAssessment, userAssessmentId, **payload.model_dump(exclude_unset=True))
+    if user_question_without_assessment or payload.model_fields_set:
+        await build_practice_queue(updated_user_assessment)
+        updated_user_assessment = await get_record(UserAssessment, userAssessmentId)
+    return updated_user_assessment
 
 
 @router.get("/userAssessments/{userAssessmentId}/userQuestions", response_model=List[UserQuestion])
@@ -83,14 +87,14 @@ async def get_user_assessment(userAssessmentId: UUID):
     if not user_assessment:
         raise HTTPException(status_code=404, detail="User assessment not found")
 
-    question_details = await get_all_records(UserQuestion,
-                                             filter_by={"userAssessmentId": userAssessmentId, "isStudyComplete": False})
-    total_questions = len(question_details)
+    if not user_assessment.questionCountToPractice:
+        raise HTTPException(status_code=400, detail="Question count to practice not set for this user assessment")
+
+    # Assessments created before practice queues existed get theirs built on first read
+    if not user_assessment.practiceQueueBuiltAt:
+        await build_practice_queue(user_assessment, only_if_unbuilt=True)
 
-    question_count_to_practice = user_assessment.questionCountToPractice
-    selected_indices = random.sample(range(total_questions), question_count_to_practice)
-    selected_questions = [question_details[i] for i in selected_indices]
-    return selected_questions
+    return await get_practice_questions(userAssessmentId, limit=user_assessment.questionCountToPractice)
 
 
 @router.put("/chatInteractions", response_model=ChatInteraction)
@@ -1,4 +1,5 @@
 from sqlmodel import SQLModel, Field, Relationship
+from sqlalchemy import Index
 from pydantic import BaseModel, field_validator
 from uuid import UUID, uuid4
 from enum import Enum
@@ -16,6 +17,12 @@ class QuestionComplexityEnum(str, Enum):
     EASY = "EASY"
     MEDIUM = "MEDIUM"
     HARD = "HARD"
+
+
+class PracticeOrderPolicyEnum(str, Enum):
+    COMPLEXITY = "COMPLEXITY"
+    WRONG_FIRST = "WRONG_FIRST"
+    RANDOM = "RANDOM"
     
 
 class ChatMessageTypeEnum(str, Enum):
@@ -91,7 +98,9 @@ class UserQuestion(SQLModel, table=True):
 
 
 class UserAssessmentUpdateModel(SQLModel):
-    questionCountToPractice: int | None = 1
+    questionCountToPractice: int | None = Field(default=1, ge=1)
+    practiceOrderPolicy: PracticeOrderPolicyEnum | None = None
+    practiceSeed: int | None = None
     
     
 class UserAssessmentCreateModel(UserAssessmentUpdateModel):
@@ -118,3 +127,16 @@ class UserAssessment(UserAssessmentCreateModel, table=True):
     totalQuestions: int | None = None
     totalQuestionsAnsweredCorrectly: int | None = None
     totalQuestionsAnsweredWrong: int | None = None
+    practiceQueueBuiltAt: datetime | None = None
+
+
+class UserPracticeQueue(SQLModel, table=True):
+    __tablename__ = "user_practice_queue"
+    __table_args__ = (
+        Index("ix_user_practice_queue_assessment_position", "userAssessmentId", "position", unique=True),
+    )
+    id: UUID = Field(default_factory=uuid4, primary_key=True)
+    userAssessmentId: UUID = Field(foreign_key="user_assessment.id")
+    userQuestionId: UUID = Field(foreign_key="user_question.id")
+    position: int
+    createdAt: datetime = Field(default_factory=datetime.utcnow)
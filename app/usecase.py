@@ -1,12 +1,21 @@
 import json
+import os
+import random
 from app.dependencies.openai_client import openai_chat_completion
 from app.dependencies.http import get
 from uuid import UUID
 from datetime import datetime
-from app.db_adapter import insert_into_sqlite, get_all_records
-from app.schema import UserQuestion, QuestionRefinement, ChatMessage, ChatMessageTypeEnum, ChatInteraction, UserAssessment, FinalEvaluationReport
+from app.db_adapter import insert_into_sqlite, get_all_records, replace_practice_queue
+from app.schema import UserQuestion, QuestionRefinement, ChatMessage, ChatMessageTypeEnum, ChatInteraction, UserAssessment, FinalEvaluationReport, PracticeOrderPolicyEnum, QuestionComplexityEnum, UserPracticeQueue
 from typing import List, Dict
 
+PRACTICE_ORDER_POLICY = PracticeOrderPolicyEnum(os.getenv("PRACTICE_ORDER_POLICY", PracticeOrderPolicyEnum.RANDOM.value))
+QUESTION_COMPLEXITY_RANK = {
+    QuestionComplexityEnum.EASY: 0,
+    QuestionComplexityEnum.MEDIUM: 1,
+    QuestionComplexityEnum.HARD: 2,
+}
+
 async def evaluate_question_complexity(extracted_question_data: List[UserQuestion]):
     question_list = []
     
@@ -213,3 +222,43 @@ async def generate_final_evaluation_report(user_assessment: UserAssessment, user
         output_schema=FinalEvaluationReport
     )
     return json.loads(final_evaluation)
+
+
+def question_complexity_rank(user_question: UserQuestion) -> int:
+    return QUESTION_COMPLEXITY_RANK.get(user_question.questionComplexity, len(QUESTION_COMPLEXITY_RANK))
+
+
+def order_practice_questions(user_questions: List[UserQuestion], policy: PracticeOrderPolicyEnum, seed: int | None = None) -> List[UserQuestion]:
+    # Start from a stable order so the same policy and seed always produce the same queue
+    ordered_questions = sorted(user_questions, key=lambda x: str(x.id))
+
+    if policy == PracticeOrderPolicyEnum.COMPLEXITY:
+        return sorted(ordered_questions, key=question_complexity_rank)
+    if policy == PracticeOrderPolicyEnum.WRONG_FIRST:
+        # Questions are imported with isStudyComplete equal to isCorrect, so every unfinished question is
+        # currently a wrong answer and this matches COMPLEXITY until the two flags can diverge
+        return sorted(ordered_questions, key=lambda x: (x.isCorrect, question_complexity_rank(x)))
+
+    random.Random(seed).shuffle(ordered_questions)
+    return ordered_questions
+
+
+async def build_practice_queue(user_assessment: UserAssessment, only_if_unbuilt: bool = False) -> bool:
+    policy = user_assessment.practiceOrderPolicy or PRACTICE_ORDER_POLICY
+    seed = user_assessment.practiceSeed
+    if policy == PracticeOrderPolicyEnum.RANDOM and seed is None:
+        seed = random.randrange(2**31)
+
+    user_questions = await get_all_records(UserQuestion, filter_by={"userAssessmentId": user_assessment.id, "isStudyComplete": False})
+    ordered_questions = order_practice_questions(user_questions, policy, seed)
+
+    practice_queue = [
+        UserPracticeQueue(
+            userAssessmentId=user_assessment.id,
+            userQuestionId=user_question.id,
+            position=position
+        )
+        for position, user_question in enumerate(ordered_questions)
+    ]
+    return await replace_practice_queue(user_assessment.id, practice_queue, only_if_unbuilt,
+                                        practiceOrderPolicy=policy, practiceSeed=seed)